@@ -1,18 +1,29 @@
 import time
+import queue
+import asyncio
 import socket
 import threading
-import configparser
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 import os
 import sys
 import traceback
 
-import customtkinter
-import tkinter.messagebox as mbox
+# customtkinter is imported on first use by _ctk(); config loading and probing don't need it.
+customtkinter = None
+
+
+def _ctk():
+    global customtkinter
+    if customtkinter is None:
+        import customtkinter as _c
+        customtkinter = _c
+    return customtkinter
+
 
 def _gui_excepthook(exc_type, exc, tb):
+    import tkinter.messagebox as mbox
+
     msg = "".join(traceback.format_exception(exc_type, exc, tb))
     mbox.showerror("Unexpected Error", msg)
 
@@ -27,6 +38,14 @@ CARD_ALT = "#121829"
 BORDER = "#27324A"
 TEXT_MUTED = "#9CA3AF"
 
+STATUS_STYLE = {
+    "OPEN": ("#064E3B", "#34D399"),
+    "CLOSED": ("#7F1D1D", "#FCA5A5"),
+    "TIMEOUT": ("#78350F", "#FBBF24"),
+    "DNS_FAIL": ("#312E81", "#A5B4FC"),
+}
+DEFAULT_STATUS_STYLE = ("#374151", "#E5E7EB")
+
 APP_NAME = "IsThePortOpen"
 INI_FILENAME  = "itpo.ini"
 
@@ -53,27 +72,64 @@ class Target:
     name: str
     host: str
     port: int
+    # (family, sockaddr) for IP-literal hosts, False for hostnames, None until probed.
+    _resolved: tuple | bool | None = field(default=None, init=False, repr=False, compare=False)
 
 
-def _read_ini(path: str) -> configparser.ConfigParser:
-    cfg = configparser.ConfigParser(inline_comment_prefixes=(";", "#"))
-    cfg.optionxform = str
-    p = Path(path)
-    if p.exists():
-        cfg.read(path)
-    return cfg
+_ini_cache: tuple[tuple | None, dict[str, dict[str, str]] | None] = (None, None)
+_state_cache: tuple[tuple | None, tuple | None] = (None, None)
+_last_blob: tuple[tuple | None, int] = (None, 0)
+
+
+def _ini_key(path: str) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def parse_ini(path: str) -> dict[str, dict[str, str]]:
+    global _ini_cache
+    key = _ini_key(path)
+    if key is None:
+        return {}
+    if _ini_cache[0] == key:
+        return _ini_cache[1]
+
+    sections: dict[str, dict[str, str]] = {}
+    cur = None
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        s = line.strip()
+        if not s or s[0] in ";#":
+            continue
+        if s[0] == "[":
+            cur = sections.setdefault(s[1:-1].strip(), {})
+        elif cur is not None:
+            k, _, v = s.partition("=")
+            cur[k.strip()] = v.split(";", 1)[0].split("#", 1)[0].strip()
+
+    _ini_cache = (key, sections)
+    return sections
 
 
 def load_state(path: str = INI_PATH):
-    cfg = _read_ini(path)
+    global _state_cache
+    key = _ini_key(path)
+    if key is not None and _state_cache[0] == key:
+        timeout, max_workers, auto_refresh, targets = _state_cache[1]
+        return timeout, max_workers, auto_refresh, [Target(t.name, t.host, t.port) for t in targets]
 
-    timeout = cfg.getfloat("SETTINGS", "TIMEOUT_SECONDS", fallback=5.0)
-    max_workers = cfg.getint("SETTINGS", "MAX_WORKERS", fallback=10)
-    auto_refresh = cfg.getint("SETTINGS", "AUTO_REFRESH_SECONDS", fallback=0)
+    ini = parse_ini(path)
+    settings = ini.get("SETTINGS", {})
+
+    timeout = float(settings.get("TIMEOUT_SECONDS", 5.0))
+    max_workers = int(settings.get("MAX_WORKERS", 10))
+    auto_refresh = int(settings.get("AUTO_REFRESH_SECONDS", 0))
 
     targets: list[Target] = []
-    if cfg.has_section("TARGETS"):
-        for name, value in cfg["TARGETS"].items():
+    if "TARGETS" in ini:
+        for name, value in ini["TARGETS"].items():
             raw = value.strip()
             if ":" not in raw:
                 continue
@@ -90,48 +146,193 @@ def load_state(path: str = INI_PATH):
             if host and name.strip():
                 targets.append(Target(name=name.strip(), host=host, port=port))
 
+    if key is not None:
+        _state_cache = (key, (timeout, max_workers, auto_refresh, [Target(t.name, t.host, t.port) for t in targets]))
     return timeout, max_workers, auto_refresh, targets
 
 
 def save_state(timeout: float, max_workers: int, auto_refresh: int, targets: list[Target], path: str = INI_PATH):
-    cfg = configparser.ConfigParser(inline_comment_prefixes=(";", "#"))
-    cfg.optionxform = str
-
-    cfg["SETTINGS"] = {
-        "TIMEOUT_SECONDS": str(timeout),
-        "MAX_WORKERS": str(max_workers),
-        "AUTO_REFRESH_SECONDS": str(auto_refresh),
+    global _ini_cache, _state_cache, _last_blob
+    sections = {
+        "SETTINGS": {
+            "TIMEOUT_SECONDS": str(timeout),
+            "MAX_WORKERS": str(max_workers),
+            "AUTO_REFRESH_SECONDS": str(auto_refresh),
+        },
+        "TARGETS": {t.name: f"{t.host}:{t.port}" for t in targets},
     }
 
-    cfg["TARGETS"] = {}
-    for t in targets:
-        cfg["TARGETS"][t.name] = f"{t.host}:{t.port}"
+    target_lines = "".join(f"{name} = {value}\n" for name, value in sections["TARGETS"].items())
+    blob = (
+        f"[SETTINGS]\n"
+        f"TIMEOUT_SECONDS = {timeout}\n"
+        f"MAX_WORKERS = {max_workers}\n"
+        f"AUTO_REFRESH_SECONDS = {auto_refresh}\n"
+        f"\n"
+        f"[TARGETS]\n"
+        f"{target_lines}"
+    ).encode("utf-8")
+
+    # Nothing to do if this exact blob is what we last wrote and the file hasn't changed since.
+    blob_hash = hash(blob)
+    if _last_blob == (_ini_key(path), blob_hash):
+        return
 
     tmp_path = f"{path}.tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        cfg.write(f)
-    Path(tmp_path).replace(path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+    key = _ini_key(path)
+    _last_blob = (key, blob_hash)
+    _ini_cache = (key, sections)
+    _state_cache = (key, (timeout, max_workers, auto_refresh, [Target(t.name, t.host, t.port) for t in targets]))
+
+DNS_TTL_SECONDS = 300
+
+_dns_cache: dict[tuple[str, int], tuple[float, list]] = {}
+_dns_lock = threading.Lock()
+
+
+def _cached_addrinfo(host: str, port: int) -> list | None:
+    with _dns_lock:
+        hit = _dns_cache.get((host, port))
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def resolve(host: str, port: int, ttl: float = DNS_TTL_SECONDS) -> list:
+    infos = _cached_addrinfo(host, port)
+    if infos is not None:
+        return infos
+
+    key = (host, port)
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror:
+        with _dns_lock:
+            _dns_cache.pop(key, None)
+        raise
+
+    with _dns_lock:
+        _dns_cache[key] = (time.monotonic() + ttl, infos)
+    return infos
+
 
-def check_tcp_open(host: str, port: int, timeout_seconds: float):
-    start = time.perf_counter()
+def _literal_sockaddr(host: str, port: int) -> tuple | None:
     try:
-        with socket.create_connection((host, port), timeout=timeout_seconds):
+        socket.inet_pton(socket.AF_INET, host)
+        return socket.AF_INET, (host, port)
+    except (OSError, ValueError):
+        pass
+    try:
+        socket.inet_pton(socket.AF_INET6, host)
+        return socket.AF_INET6, (host, port, 0, 0)
+    except (OSError, ValueError):
+        return None
+
+
+# Python 3.11+ can time out the connect in place; wait_for wraps it in an extra Task per probe.
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+
+async def probe(t: Target, timeout_seconds: float):
+    loop = asyncio.get_running_loop()
+
+    if t._resolved is None:
+        t._resolved = _literal_sockaddr(t.host, t.port) or False
+
+    if t._resolved:
+        af, sockaddr = t._resolved
+        addrs = [(af, socket.SOCK_STREAM, 0, sockaddr)]
+    else:
+        try:
+            infos = _cached_addrinfo(t.host, t.port)
+            if infos is None:
+                infos = await loop.run_in_executor(None, resolve, t.host, t.port)
+        except socket.gaierror:
+            return "DNS_FAIL", None
+        addrs = [(af, socktype, proto, sockaddr) for af, socktype, proto, _, sockaddr in infos]
+
+    # Like socket.create_connection, try each address in turn; they share one deadline.
+    status = "ERROR"
+    deadline = time.perf_counter() + timeout_seconds
+    for af, socktype, proto, sockaddr in addrs:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return "TIMEOUT", None
+
+        sock = None
+        try:
+            sock = socket.socket(af, socktype, proto)
+            sock.setblocking(False)
+            start = time.perf_counter()
+            if _asyncio_timeout is not None:
+                async with _asyncio_timeout(remaining):
+                    await loop.sock_connect(sock, sockaddr)
+            else:
+                await asyncio.wait_for(loop.sock_connect(sock, sockaddr), remaining)
             latency_ms = (time.perf_counter() - start) * 1000.0
             return "OPEN", latency_ms
-    except socket.gaierror:
-        return "DNS_FAIL", None
-    except TimeoutError:
-        return "TIMEOUT", None
-    except OSError as e:
-        if isinstance(e, ConnectionRefusedError):
-            return "CLOSED", None
-        return "ERROR", None
+        except ConnectionRefusedError:
+            status = "CLOSED"
+        except asyncio.TimeoutError:
+            return "TIMEOUT", None
+        except OSError:
+            status = "ERROR"
+        finally:
+            if sock is not None:
+                sock.close()
+
+    return status, None
+
+
+async def gather_probes(targets: list[Target], timeout_seconds: float, limit: asyncio.Semaphore, on_result=None):
+    async def bounded(i: int, t: Target):
+        async with limit:
+            result = await probe(t, timeout_seconds)
+        if on_result:
+            on_result(i, result)
+        return result
+
+    tasks = [asyncio.create_task(bounded(i, t)) for i, t in enumerate(targets)]
+    try:
+        return [await task for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class AtomicBool:
+    def __init__(self, value: bool = False):
+        self._v = value
+        self._l = threading.Lock()
+
+    @property
+    def value(self) -> bool:
+        return self._v
+
+    def cas(self, expected: bool, new: bool) -> bool:
+        with self._l:
+            if self._v != expected:
+                return False
+            self._v = new
+            return True
+
 
 class TargetRow:
     def __init__(self, parent, target: Target, idx: int, on_delete):
         self.target = target
         self.on_delete = on_delete
 
+        self.idx = idx
         row_color = CARD if (idx % 2 == 0) else CARD_ALT
 
         self.frame = customtkinter.CTkFrame(
@@ -206,6 +407,11 @@ class TargetRow:
 
         self.frame.grid_columnconfigure(1, weight=1)
 
+    def set_index(self, idx: int):
+        if (idx % 2) != (self.idx % 2):
+            self.frame.configure(fg_color=(CARD if (idx % 2 == 0) else CARD_ALT))
+        self.idx = idx
+
     def _delete_clicked(self):
         if self.on_delete:
             self.on_delete(self)
@@ -214,55 +420,34 @@ class TargetRow:
         self.delete_btn.configure(state=("normal" if enabled else "disabled"))
 
     def set_checking(self):
-        self.status_label.configure(
-            text="Checking...",
-            text_color="#E5E7EB",
-            fg_color="#374151"
-        )
+        fg, txt = DEFAULT_STATUS_STYLE
+        self.status_label.configure(text="Checking...", text_color=txt, fg_color=fg)
 
     def set_result(self, status: str, latency_ms: float | None):
-        if status == "OPEN":
-            fg = "#064E3B"
-            txt = "#34D399"
-        elif status == "CLOSED":
-            fg = "#7F1D1D"
-            txt = "#FCA5A5"
-        elif status == "TIMEOUT":
-            fg = "#78350F"
-            txt = "#FBBF24"
-        elif status == "DNS_FAIL":
-            fg = "#312E81"
-            txt = "#A5B4FC"
-        else:
-            fg = "#374151"
-            txt = "#E5E7EB"
-
-        label = status
-        if status == "OPEN" and latency_ms is not None:
-            label = f"OPEN ({latency_ms:.0f}ms)"
-
+        fg, txt = STATUS_STYLE.get(status, DEFAULT_STATUS_STYLE)
+        label = f"OPEN ({latency_ms:.0f}ms)" if latency_ms is not None and status == "OPEN" else status
         self.status_label.configure(text=label, text_color=txt, fg_color=fg)
 
     def destroy(self):
         self.frame.destroy()
 
 
-class AddTargetDialog(customtkinter.CTkToplevel):
+class AddTargetDialog:
     def __init__(self, master, on_submit):
-        super().__init__(master)
+        self.window = customtkinter.CTkToplevel(master)
         self.on_submit = on_submit
-        self.title("Add Target")
-        self.geometry("420x240")
-        self.resizable(False, False)
-        self.configure(fg_color=SURFACE)
+        self.window.title("Add Target")
+        self.window.geometry("420x240")
+        self.window.resizable(False, False)
+        self.window.configure(fg_color=SURFACE)
 
-        self.grab_set()
-        self.focus()
+        self.window.grab_set()
+        self.window.focus()
 
-        title = customtkinter.CTkLabel(self, text="Add Target", font=("Arial", 18, "bold"), text_color=ACCENT_2)
+        title = customtkinter.CTkLabel(self.window, text="Add Target", font=("Arial", 18, "bold"), text_color=ACCENT_2)
         title.pack(pady=(8, 4))
 
-        form = customtkinter.CTkFrame(self, corner_radius=12, fg_color=SURFACE_2, border_width=1, border_color=BORDER)
+        form = customtkinter.CTkFrame(self.window, corner_radius=12, fg_color=SURFACE_2, border_width=1, border_color=BORDER)
         form.pack(fill="x", padx=14, pady=1)
 
         form.grid_columnconfigure(0, weight=0)
@@ -288,16 +473,16 @@ class AddTargetDialog(customtkinter.CTkToplevel):
         self.port = customtkinter.CTkEntry(form, placeholder_text="Port (1-65535)", font=entry_font)
         self.port.grid(row=2, column=1, padx=(0, 12), pady=6, sticky="ew")
 
-        self.error = customtkinter.CTkLabel(self, text="", font=("Arial", 12), text_color="#FCA5A5")
+        self.error = customtkinter.CTkLabel(self.window, text="", font=("Arial", 12), text_color="#FCA5A5")
         self.error.pack(pady=(1, 5))
 
-        btns = customtkinter.CTkFrame(self, fg_color="transparent")
+        btns = customtkinter.CTkFrame(self.window, fg_color="transparent")
         btns.pack(pady=0)
 
         cancel = customtkinter.CTkButton(
             btns, text="Cancel", width=120, height=34, corner_radius=12,
             fg_color="#374151", hover_color="#4B5563",
-            command=self.destroy
+            command=self.window.destroy
         )
         cancel.grid(row=0, column=0, padx=8)
 
@@ -308,8 +493,8 @@ class AddTargetDialog(customtkinter.CTkToplevel):
         )
         add.grid(row=0, column=1, padx=8)
 
-        self.bind("<Return>", lambda e: self._submit())
-        self.bind("<Escape>", lambda e: self.destroy())
+        self.window.bind("<Return>", lambda e: self._submit())
+        self.window.bind("<Escape>", lambda e: self.window.destroy())
 
     def _submit(self):
         if self.error.winfo_manager():
@@ -334,25 +519,25 @@ class AddTargetDialog(customtkinter.CTkToplevel):
             return
 
         self.on_submit(Target(name=name, host=host, port=port))
-        self.destroy()
+        self.window.destroy()
 
 
-class SettingsDialog(customtkinter.CTkToplevel):
+class SettingsDialog:
     def __init__(self, master, timeout: float, max_workers: int, auto_refresh: int, on_apply):
-        super().__init__(master)
+        self.window = customtkinter.CTkToplevel(master)
         self.on_apply = on_apply
-        self.title("Settings")
-        self.geometry("420x240")
-        self.resizable(False, False)
-        self.configure(fg_color=SURFACE)
+        self.window.title("Settings")
+        self.window.geometry("420x240")
+        self.window.resizable(False, False)
+        self.window.configure(fg_color=SURFACE)
 
-        self.grab_set()
-        self.focus()
+        self.window.grab_set()
+        self.window.focus()
 
-        title = customtkinter.CTkLabel(self, text="Settings", font=("Arial", 18, "bold"), text_color=ACCENT_2)
+        title = customtkinter.CTkLabel(self.window, text="Settings", font=("Arial", 18, "bold"), text_color=ACCENT_2)
         title.pack(pady=(8, 4))
 
-        form = customtkinter.CTkFrame(self, corner_radius=12, fg_color=SURFACE_2, border_width=1, border_color=BORDER)
+        form = customtkinter.CTkFrame(self.window, corner_radius=12, fg_color=SURFACE_2, border_width=1, border_color=BORDER)
         form.pack(fill="x", padx=14, pady=1)
 
         form.grid_columnconfigure(0, weight=0)
@@ -373,16 +558,16 @@ class SettingsDialog(customtkinter.CTkToplevel):
         self.max_workers = mk_row("Max workers:", 1, max_workers)
         self.auto_refresh = mk_row("Auto refresh:", 2, auto_refresh)
 
-        self.error = customtkinter.CTkLabel(self, text="", font=("Arial", 12), text_color="#FCA5A5")
+        self.error = customtkinter.CTkLabel(self.window, text="", font=("Arial", 12), text_color="#FCA5A5")
         self.error.pack(pady=(1, 5))
 
-        btns = customtkinter.CTkFrame(self, fg_color="transparent")
+        btns = customtkinter.CTkFrame(self.window, fg_color="transparent")
         btns.pack(pady=0)
 
         cancel = customtkinter.CTkButton(
             btns, text="Cancel", width=120, height=34, corner_radius=12,
             fg_color="#374151", hover_color="#4B5563",
-            command=self.destroy
+            command=self.window.destroy
         )
         cancel.grid(row=0, column=0, padx=8)
 
@@ -393,8 +578,8 @@ class SettingsDialog(customtkinter.CTkToplevel):
         )
         apply_btn.grid(row=0, column=1, padx=8)
 
-        self.bind("<Return>", lambda e: self._apply())
-        self.bind("<Escape>", lambda e: self.destroy())
+        self.window.bind("<Return>", lambda e: self._apply())
+        self.window.bind("<Escape>", lambda e: self.window.destroy())
 
     def _apply(self):
         try:
@@ -422,45 +607,58 @@ class SettingsDialog(customtkinter.CTkToplevel):
             return
 
         self.on_apply(timeout, max_workers, auto_refresh)
-        self.destroy()
+        self.window.destroy()
 
-class App(customtkinter.CTk):
+class App:
     def __init__(self):
-        super().__init__()
+        # Read the config before pulling in Tk so a broken file fails fast.
+        self.timeout, self.max_workers, self.auto_refresh_seconds, targets = load_state()
 
+        _ctk()
         customtkinter.set_appearance_mode("Dark")
         customtkinter.set_default_color_theme("blue")
 
-        self.title("Is The Port Open - v1.0")
-        self.geometry("700x600")
-        self.minsize(700, 600)
-        self.resizable(False, True)
-        self.configure(fg_color=SURFACE)
+        self.window = customtkinter.CTk()
+        self.window.title("Is The Port Open - v1.0")
+        self.window.geometry("700x600")
+        self.window.minsize(700, 600)
+        self.window.resizable(False, True)
+        self.window.configure(fg_color=SURFACE)
 
-        self.timeout, self.max_workers, self.auto_refresh_seconds, targets = load_state()
-
-        self.targets: list[Target] = list(targets)
+        self.targets: dict[int, Target] = {id(t): t for t in targets}
+        self._name_set = {t.name for t in targets}
         self.rows: list[TargetRow] = []
 
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
-        self.refresh_lock = threading.Lock()
-        self.refresh_in_progress = False
-        self._auto_after_id = None
+        # With no INI on disk yet, leave the hash unset so the first persist/close writes one.
+        self._last_persist_hash = self._state_hash() if _ini_key(INI_PATH) is not None else None
+        self._save_after_id = None
+
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="itpo-scan", daemon=True).start()
+        self._concurrency = asyncio.Semaphore(self.max_workers)
+        self._result_q = queue.SimpleQueue()
+
+        self._refresh_started = AtomicBool()
+        self._session_id = 0
+        self._last_stamp_minute = None
+        self._last_stamp_str = ""
+        self._scan_future = None
+        self._refresh_gen = 0
 
         title = customtkinter.CTkLabel(
-            self, text="Is The Port Open", font=("Arial", 22, "bold"),
+            self.window, text="Is The Port Open", font=("Arial", 22, "bold"),
             text_color=ACCENT_2
         )
         title.pack(pady=(14, 6))
 
         self.meta_label = customtkinter.CTkLabel(
-            self, text="Last checked: —", font=("Arial", 12),
+            self.window, text="Last checked: —", font=("Arial", 12),
             text_color=TEXT_MUTED
         )
         self.meta_label.pack(pady=(0, 8))
 
         header = customtkinter.CTkFrame(
-            self, corner_radius=12, fg_color=SURFACE_2, border_width=1, border_color=BORDER
+            self.window, corner_radius=12, fg_color=SURFACE_2, border_width=1, border_color=BORDER
         )
         header.pack(fill="x", padx=10, pady=(12, 0))
 
@@ -500,7 +698,7 @@ class App(customtkinter.CTk):
 
         header.grid_columnconfigure(1, weight=1)
 
-        self.scroll = customtkinter.CTkScrollableFrame(self)
+        self.scroll = customtkinter.CTkScrollableFrame(self.window)
         self.scroll.pack(padx=10, pady=8, fill="both", expand=True)
 
         self.add_row_frame = customtkinter.CTkFrame(
@@ -522,7 +720,7 @@ class App(customtkinter.CTk):
             command=self.open_add_dialog,
         )
 
-        controls = customtkinter.CTkFrame(self, fg_color="transparent")
+        controls = customtkinter.CTkFrame(self.window, fg_color="transparent")
         controls.pack(pady=14)
 
         self.settings_button = customtkinter.CTkButton(
@@ -548,50 +746,70 @@ class App(customtkinter.CTk):
         self.refresh_async()
         self._schedule_auto_refresh()
 
-        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def rebuild_rows(self):
-        for r in self.rows:
+        # Targets are only ever appended or deleted, so surviving rows keep their
+        # relative order; only new rows need to be packed into place.
+        existing = {id(r.target): r for r in self.rows}
+
+        rows: list[TargetRow] = []
+        prev = None
+        for i, t in enumerate(self.targets.values()):
+            row = existing.pop(id(t), None)
+            if row is None:
+                row = TargetRow(self.scroll, t, i, on_delete=self.delete_row)
+                if prev is not None:
+                    row.frame.pack_configure(after=prev.frame)
+                else:
+                    first = self.scroll.pack_slaves()[0]
+                    if first is not row.frame:
+                        row.frame.pack_configure(before=first)
+            else:
+                row.set_index(i)
+
+            rows.append(row)
+            prev = row
+
+        for r in existing.values():
             r.destroy()
-        self.rows.clear()
-
-        for i, t in enumerate(self.targets):
-            self.rows.append(TargetRow(self.scroll, t, i, on_delete=self.delete_row))
+        self.rows = rows
 
         self.add_row_frame.pack(fill="x", padx=10, pady=(10, 10))
         self.add_btn.pack(pady=10)
 
     def delete_row(self, row: TargetRow):
-        if self.refresh_in_progress:
+        if self._refresh_started.value:
             return 
-        self.targets = [t for t in self.targets if not (t.name == row.target.name and t.host == row.target.host and t.port == row.target.port)]
+        del self.targets[id(row.target)]
+        self._name_set.discard(row.target.name)
         self.persist()
         self.rebuild_rows()
 
     def open_add_dialog(self):
-        if self.refresh_in_progress:
+        if self._refresh_started.value:
             return
-        AddTargetDialog(self, on_submit=self.add_target)
+        AddTargetDialog(self.window, on_submit=self.add_target)
 
     def add_target(self, t: Target):
-        existing = {x.name for x in self.targets}
         base = t.name
-        if base in existing:
+        if base in self._name_set:
             n = 2
-            while f"{base} ({n})" in existing:
+            while f"{base} ({n})" in self._name_set:
                 n += 1
             t.name = f"{base} ({n})"
 
-        self.targets.append(t)
+        self._name_set.add(t.name)
+        self.targets[id(t)] = t
         self.persist()
         self.rebuild_rows()
         self.refresh_async()
 
     def open_settings(self):
-        if self.refresh_in_progress:
+        if self._refresh_started.value:
             return
         SettingsDialog(
-            self,
+            self.window,
             timeout=self.timeout,
             max_workers=self.max_workers,
             auto_refresh=self.auto_refresh_seconds,
@@ -599,47 +817,59 @@ class App(customtkinter.CTk):
         )
 
     def apply_settings(self, timeout: float, max_workers: int, auto_refresh: int):
-        old_workers = self.max_workers
+        if max_workers != self.max_workers:
+            self._concurrency = asyncio.Semaphore(max_workers)
 
         self.timeout = timeout
         self.max_workers = max_workers
         self.auto_refresh_seconds = auto_refresh
 
-        if self.max_workers != old_workers:
-            try:
-                self.executor.shutdown(wait=False, cancel_futures=True)
-            except Exception:
-                pass
-            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
-
         self.persist()
         self._schedule_auto_refresh()
 
         self.refresh_async()
 
     def _schedule_auto_refresh(self):
-        if self._auto_after_id is not None:
-            try:
-                self.after_cancel(self._auto_after_id)
-            except Exception:
-                pass
-            self._auto_after_id = None
+        # Older callbacks see a different generation and do nothing when they fire.
+        self._refresh_gen += 1
 
         if self.auto_refresh_seconds and self.auto_refresh_seconds > 0:
-            self._auto_after_id = self.after(self.auto_refresh_seconds * 1000, self._auto_refresh_tick)
+            self.window.after(self.auto_refresh_seconds * 1000, lambda g=self._refresh_gen: self._auto_refresh_tick(g))
 
-    def _auto_refresh_tick(self):
-        self.refresh_async()
+    def _auto_refresh_tick(self, gen: int):
+        if gen != self._refresh_gen:
+            return
+        if not self._refresh_started.value:
+            self.refresh_async()
         self._schedule_auto_refresh()
 
+    def _state_hash(self) -> int:
+        return hash((
+            self.timeout,
+            self.max_workers,
+            self.auto_refresh_seconds,
+            tuple((t.name, t.host, t.port) for t in self.targets.values()),
+        ))
+
     def persist(self):
+        if self._state_hash() == self._last_persist_hash:
+            return
+        if self._save_after_id is None:
+            self._save_after_id = self.window.after(500, self._flush_pending_save)
+
+    def _flush_pending_save(self):
+        self._save_after_id = None
+        state_hash = self._state_hash()
+        if state_hash == self._last_persist_hash:
+            return
         save_state(
             timeout=self.timeout,
             max_workers=self.max_workers,
             auto_refresh=self.auto_refresh_seconds,
-            targets=self.targets,
+            targets=list(self.targets.values()),
             path=INI_PATH
         )
+        self._last_persist_hash = state_hash
 
     def _set_editing_enabled(self, enabled: bool):
         self.add_btn.configure(state=("normal" if enabled else "disabled"))
@@ -648,66 +878,85 @@ class App(customtkinter.CTk):
             r.set_delete_enabled(enabled)
 
     def refresh_async(self):
-        if self.refresh_in_progress:
-            return
-
-        with self.refresh_lock:
-            if self.refresh_in_progress:
-                return
-            self.refresh_in_progress = True
-
-        self.refresh_button.configure(state="disabled")
-        self._set_editing_enabled(False)
+        if not self._refresh_started.cas(False, True):
+            # Restart: drop the running scan; its late results are filtered by session id.
+            self._scan_future.cancel()
+        else:
+            self._set_editing_enabled(False)
+            self.window.after(50, self._drain_results)
 
         for row in self.rows:
             row.set_checking()
 
-        threading.Thread(target=self._refresh_worker, daemon=True).start()
+        self._session_id += 1
+        self._scan_future = asyncio.run_coroutine_threadsafe(
+            self._refresh_worker(self._session_id, list(self.rows)), self._loop
+        )
 
-    def _refresh_worker(self):
+    async def _refresh_worker(self, session_id: int, rows: list[TargetRow]):
+        # Results are streamed to the Tk thread through _result_q; a bool marks the end of the scan.
         try:
-            futures = {}
-            for row in list(self.rows):
-                t = row.target
-                fut = self.executor.submit(check_tcp_open, t.host, t.port, self.timeout)
-                futures[fut] = row
-
-            results = []
-            for fut in as_completed(futures):
-                row = futures[fut]
-                status, latency = fut.result()
-                results.append((row, status, latency))
-
-            def apply_results():
-                for row, status, latency in results:
-                    row.set_result(status, latency)
+            await gather_probes(
+                [row.target for row in rows], self.timeout, self._concurrency,
+                on_result=lambda i, result: self._result_q.put((session_id, (rows[i], *result))),
+            )
+            self._result_q.put((session_id, True))
+        except Exception:
+            self._result_q.put((session_id, False))
 
-                self.meta_label.configure(text=f"Last checked: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                self.refresh_button.configure(state="normal")
-                self._set_editing_enabled(True)
-                self.refresh_in_progress = False
+    def _drain_results(self):
+        applied = False
+        for _ in range(64):
+            try:
+                session_id, item = self._result_q.get_nowait()
+            except queue.Empty:
+                break
+            if session_id != self._session_id:
+                continue
 
-            self.after(0, apply_results)
+            if isinstance(item, bool):
+                if applied:
+                    self.window.update_idletasks()
+                self._finish_refresh(item)
+                return
 
-        except Exception:
-            def recover():
-                self.refresh_button.configure(state="normal")
-                self._set_editing_enabled(True)
-                self.refresh_in_progress = False
-            self.after(0, recover)
+            if not applied:
+                # Flush pending layout once so this batch of results reflows together.
+                self.scroll.update_idletasks()
+            row, status, latency = item
+            row.set_result(status, latency)
+            applied = True
+
+        if applied:
+            self.window.update_idletasks()
+        self.window.after(50, self._drain_results)
+
+    def _timestamp(self) -> str:
+        # Display-only; the date/hour/minute part is only reformatted when the minute rolls over.
+        now = int(time.time())
+        minute = now // 60
+        if minute != self._last_stamp_minute:
+            self._last_stamp_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60))
+            self._last_stamp_minute = minute
+        return f"{self._last_stamp_str}:{now % 60:02d}"
+
+    def _finish_refresh(self, completed: bool):
+        if completed:
+            self.meta_label.configure(text=f"Last checked: {self._timestamp()}")
+        self._set_editing_enabled(True)
+        self._refresh_started.cas(True, False)
 
     def on_close(self):
+        if self._save_after_id is not None:
+            self.window.after_cancel(self._save_after_id)
         try:
-            self.persist()
-        except Exception:
-            pass
-        try:
-            self.executor.shutdown(wait=False, cancel_futures=True)
+            self._flush_pending_save()
         except Exception:
             pass
-        self.destroy()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.window.destroy()
 
 
 if __name__ == "__main__":
     app = App()
-    app.mainloop()
+    app.window.mainloop()